@@ -7,22 +7,43 @@ Usage: python weather_bot.py [location] [--port /dev/ttyACM0] [--channel 0]
 """
 
 import requests
-import meshtastic
-import meshtastic.serial_interface
+from requests.adapters import HTTPAdapter
 import time
-import json
+import socket
+import orjson
+import os
 import sys
-import argparse
+import hashlib
+import zlib
+import struct
+import datetime
+import functools
+import collections
+import operator
+import stat
+import pathlib
+import tempfile
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from typing import Optional, List, Dict, Any
+import types
+from typing import Optional, List, Dict, Any, Tuple
 
 # --- Configuration ---
 DEFAULT_SERIAL_PORT = '/dev/ttyACM0'
 DEFAULT_WEATHER_LOCATION = '37397'
 DEFAULT_CHANNEL = 0
-MAX_MESSAGE_LENGTH = 200
+MAX_MESSAGE_LENGTH = 233  # UTF-8 bytes per packet, mesh_pb2.Constants.DATA_PAYLOAD_LEN
 REQUEST_TIMEOUT = 10
-MESSAGE_DELAY = 7  # seconds between messages
+INTERFACE_READY_TIMEOUT = 1.0  # max seconds to wait for the radio to report in
+ACK_TIMEOUT = 15  # max seconds to wait for an ACK before the next message
+DEFAULT_CACHE_TTL = 900  # seconds, override with WTTR_CACHE_TTL (0 disables)
+DNS_CACHE_TTL = 3600  # seconds to reuse the resolved wttr.in address
+WTTR_HOST = 'wttr.in'
+
+_CACHE_DIR = pathlib.Path(tempfile.gettempdir()) / "meshwttr_cache"
+_DNS_CACHE_PATH = _CACHE_DIR / "dns.json"
 
 # Set up logging
 logging.basicConfig(
@@ -31,26 +52,352 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _cache_ttl_from_env() -> int:
+    """Read WTTR_CACHE_TTL, falling back to the default on a bad value."""
+    value = os.environ.get('WTTR_CACHE_TTL')
+    if value is None:
+        return DEFAULT_CACHE_TTL
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring non-numeric WTTR_CACHE_TTL={value!r}, using {DEFAULT_CACHE_TTL}")
+        return DEFAULT_CACHE_TTL
+
+CACHE_TTL = _cache_ttl_from_env()
+
+# Shared HTTP session so repeated fetches reuse the TCP/TLS connection
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+atexit.register(_SESSION.close)
+
+class _PinnedHostAdapter(HTTPAdapter):
+    """Connects to a pre-resolved address while keeping the hostname for Host and TLS."""
+
+    def __init__(self, hostname: str, address: str, **kwargs):
+        self.hostname = hostname
+        self.address = address
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['server_hostname'] = self.hostname
+        kwargs['assert_hostname'] = self.hostname
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        host = f"[{self.address}]" if ':' in self.address else self.address
+        request.url = request.url.replace(f"://{self.hostname}", f"://{host}", 1)
+        request.headers['Host'] = self.hostname
+        return super().send(request, **kwargs)
+
+# Field name -> (path into the wttr.in JSON, default if the path is missing)
+_LOCATION_FIELDS = {
+    'area': (('nearest_area', 0, 'areaName', 0, 'value'), 'Unknown Location'),
+    'region': (('nearest_area', 0, 'region', 0, 'value'), '')
+}
+
+_WEATHER_FIELDS = {
+    'temp_c': (('temp_C',), 'N/A'),
+    'temp_f': (('temp_F',), 'N/A'),
+    'feels_like_c': (('FeelsLikeC',), 'N/A'),
+    'feels_like_f': (('FeelsLikeF',), 'N/A'),
+    'description': (('weatherDesc', 0, 'value'), 'N/A'),
+    'humidity': (('humidity',), 'N/A'),
+    'wind_speed': (('windspeedKmph',), 'N/A'),
+    'wind_dir': (('winddir16Point',), 'N/A'),
+    'obs_time': (('observation_time',), 'N/A'),
+    'local_time': (('localObsDateTime',), 'N/A')
+}
+
+_ASTRONOMY_FIELDS = {
+    'sunrise': (('weather', 0, 'astronomy', 0, 'sunrise'), 'N/A'),
+    'sunset': (('weather', 0, 'astronomy', 0, 'sunset'), 'N/A')
+}
+
+def _extract_fields(data: Dict[Any, Any], fields: Dict[str, Tuple[tuple, str]]) -> Dict[str, str]:
+    """Walk each field path through the weather data, falling back to its default."""
+    info = {}
+    for name, (path, default) in fields.items():
+        try:
+            info[name] = functools.reduce(operator.getitem, path, data)
+        except (KeyError, IndexError, TypeError):
+            info[name] = default
+    return info
+
+# Message templates, filled with str.format_map from the extracted field dicts
+_PRIMARY_TEMPLATE = (
+    "Weather in {location}:\n"
+    "Time: {local_time}\n"
+    "Temp: {temp_c}°C ({temp_f}°F)\n"
+    "RealFeel: {feels_like_c}°C ({feels_like_f}°F)\n"
+    "Conditions: {description}\n"
+    "Humidity: {humidity}%"
+)
+
+_SECONDARY_TEMPLATE = (
+    "Wind: {wind_speed}km/h {wind_dir}\n"
+    "Sunrise: {sunrise}\n"
+    "Sunset: {sunset}\n"
+    "Last Obs UTC: {obs_time}"
+)
+
+_CONCISE_TEMPLATE = "Weather in {location} is {condition} today"
+_CONCISE_TEMP_TEMPLATE = " with {temp_c}°C"
+_CONCISE_FEELS_TEMPLATE = " (feels like {feels_like_c}°C)"
+_CONCISE_WIND_TEMPLATE = " and winds at {wind_speed}km/h {wind_dir}"
+_CONCISE_HUMIDITY_TEMPLATE = ". Humidity {humidity}%"
+
+# Shared zlib dictionary for --compress; receivers must use the same one.
+# zlib favours matches near the end, so the most common fragments go last.
+# The leading byte of every PRIVATE_APP payload says which format follows.
+COMPRESSION_VERSION = 1
+OBSERVATION_VERSION = 2
+_COMPRESSION_DICT = (
+    "Partly cloudy Overcast Sunny Clear Light rain Mist Fog Patchy rain nearby "
+    "N NNE NE ENE E ESE SE SSE S SSW SW WSW W WNW NW NNW "
+    " today with  (feels like  and winds at . Humidity "
+    "\nWind: km/h \nSunrise: AM\nSunset: PM\nLast Obs UTC: "
+    "Weather in :\nTime: \nTemp: °C (°F)\nRealFeel: °C (°F)\n"
+    "Conditions: \nHumidity: %"
+).encode('utf-8')
+
+def compress_message(message: str) -> bytes:
+    """Compress a message against the shared dictionary, prefixed with a version byte."""
+    compressor = zlib.compressobj(level=9, wbits=-15, zdict=_COMPRESSION_DICT)
+    body = compressor.compress(message.encode('utf-8')) + compressor.flush()
+    return bytes([COMPRESSION_VERSION]) + body
+
+def decompress_message(payload: bytes) -> str:
+    """Inverse of compress_message, for use by receiving nodes."""
+    if not payload or payload[0] != COMPRESSION_VERSION:
+        raise ValueError("Unsupported compressed message version")
+    decompressor = zlib.decompressobj(wbits=-15, zdict=_COMPRESSION_DICT)
+    body = decompressor.decompress(payload[1:]) + decompressor.flush()
+    return body.decode('utf-8')
+
+# --binary observation frame: version, flags, temp and feels-like in tenths of a
+# degree C, humidity %, wind direction as a 16-point index, wind km/h, observation
+# time as a UTC epoch, followed by the UTF-8 condition text. Missing values use the
+# sentinels.
+_OBSERVATION_STRUCT = struct.Struct('<BBhhBBHI')
+_FLAG_STALE = 0x01  # served from cache after a failed refresh
+_WIND_POINTS = ('N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+                'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW')
+_MISSING_TEMP = -32768
+_MISSING_BYTE = 0xFF
+_MISSING_SPEED = 0xFFFF
+
+def encode_observation(weather_info: Dict[str, Any], stale: bool = False) -> bytes:
+    """Pack extracted weather info into a compact binary observation frame."""
+    def tenths(value):
+        number = _int_or_none(value)
+        if number is None:
+            return _MISSING_TEMP
+        return _clamp(number * 10, _MISSING_TEMP + 1, 32767)
+
+    wind_dir = weather_info['wind_dir']
+    wind_point = _WIND_POINTS.index(wind_dir) if wind_dir in _WIND_POINTS else _MISSING_BYTE
+    humidity = weather_info['humidity']
+    wind_speed = weather_info['wind_speed']
+
+    header = _OBSERVATION_STRUCT.pack(
+        OBSERVATION_VERSION,
+        _FLAG_STALE if stale else 0,
+        tenths(weather_info['temp_c']),
+        tenths(weather_info['feels_like_c']),
+        _MISSING_BYTE if humidity is None else _clamp(humidity, 0, 100),
+        wind_point,
+        _MISSING_SPEED if wind_speed is None else _clamp(wind_speed, 0, _MISSING_SPEED - 1),
+        _observation_epoch(weather_info['obs_time'], weather_info['local_time'])
+    )
+    description = '' if weather_info['description'] == 'N/A' else weather_info['description']
+
+    # Keep the frame within one packet, cutting the text on a character boundary
+    encoded = description.encode('utf-8')[:MAX_MESSAGE_LENGTH - _OBSERVATION_STRUCT.size]
+    return header + encoded.decode('utf-8', 'ignore').encode('utf-8')
+
+def _clamp(value: int, low: int, high: int) -> int:
+    """Limit a value to the range a frame field can hold."""
+    return max(low, min(value, high))
+
+def decode_observation(payload: bytes) -> Dict[str, Any]:
+    """Inverse of encode_observation, for use by receiving nodes."""
+    if not payload or payload[0] != OBSERVATION_VERSION:
+        raise ValueError("Unsupported observation version")
+    if len(payload) < _OBSERVATION_STRUCT.size:
+        raise ValueError("Truncated observation")
+
+    (_, flags, temp, feels, humidity, wind_point, wind_speed,
+     obs_epoch) = _OBSERVATION_STRUCT.unpack_from(payload)
+    return {
+        'temp_c': None if temp == _MISSING_TEMP else temp / 10,
+        'feels_like_c': None if feels == _MISSING_TEMP else feels / 10,
+        'humidity': None if humidity == _MISSING_BYTE else humidity,
+        'wind_dir': _WIND_POINTS[wind_point] if wind_point < len(_WIND_POINTS) else None,
+        'wind_speed': None if wind_speed == _MISSING_SPEED else wind_speed,
+        'obs_epoch': obs_epoch or None,
+        'description': payload[_OBSERVATION_STRUCT.size:].decode('utf-8') or None,
+        'stale': bool(flags & _FLAG_STALE)
+    }
+
+def _observation_epoch(obs_time: str, local_time: str) -> int:
+    """Combine wttr.in's UTC observation time with the date from its local timestamp."""
+    try:
+        utc_time = datetime.datetime.strptime(obs_time, '%I:%M %p').time()
+        local = datetime.datetime.strptime(local_time, '%Y-%m-%d %I:%M %p')
+    except (ValueError, TypeError):
+        return 0
+
+    # localObsDateTime carries no UTC offset, so the UTC date may be a day either
+    # side of the local one; pick the day that gives an offset in [-10h, +14h)
+    observed = datetime.datetime.combine(local.date(), utc_time)
+    offset = local - observed
+    if offset >= datetime.timedelta(hours=14):
+        observed += datetime.timedelta(days=1)
+    elif offset < datetime.timedelta(hours=-10):
+        observed -= datetime.timedelta(days=1)
+    return int(observed.replace(tzinfo=datetime.timezone.utc).timestamp())
+
+def _int_or_none(value: Any) -> Optional[int]:
+    """Parse an integer field from the weather data, or None if it isn't one."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+def _for_display(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Render missing (None) values as 'N/A' for the message templates."""
+    return {key: 'N/A' if value is None else value for key, value in info.items()}
+
+def _secure_cache_dir() -> bool:
+    """Create the cache directory private to this user; refuse one owned by anyone else."""
+    # It sits in the shared temp dir, where another local user could create it
+    # first and plant weather bodies for us to broadcast, or a DNS entry to pin
+    try:
+        _CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = os.lstat(_CACHE_DIR)
+        if not stat.S_ISDIR(st.st_mode):
+            raise OSError("not a directory")
+        if hasattr(os, 'getuid') and st.st_uid != os.getuid():
+            raise OSError("owned by another user")
+        if st.st_mode & 0o077:
+            os.chmod(_CACHE_DIR, 0o700)
+    except OSError as e:
+        logger.warning(f"Not using weather cache at {_CACHE_DIR}: {e}")
+        return False
+    return True
+
+def _cache_path(location: str) -> pathlib.Path:
+    """Return the on-disk cache file for a weather location."""
+    return _CACHE_DIR / (hashlib.sha1(location.encode()).hexdigest() + ".json")
+
+def _resolve_wttr() -> Optional[str]:
+    """Return wttr.in's address, reusing the on-disk copy while it is fresh."""
+    # Without a trusted cache there is nothing to reuse, so let requests resolve normally
+    if CACHE_TTL <= 0 or not _secure_cache_dir():
+        return None
+
+    try:
+        if time.time() - os.stat(_DNS_CACHE_PATH).st_mtime < DNS_CACHE_TTL:
+            return orjson.loads(_DNS_CACHE_PATH.read_bytes())['address']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    # getaddrinfo returns IPv6 as well as IPv4, in the system's preferred order
+    try:
+        address = socket.getaddrinfo(WTTR_HOST, 443, type=socket.SOCK_STREAM)[0][4][0]
+    except (OSError, IndexError) as e:
+        logger.warning(f"Could not resolve {WTTR_HOST}: {e}")
+        return None
+
+    tmp_path = _DNS_CACHE_PATH.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        tmp_path.write_bytes(orjson.dumps({'address': address}))
+        os.replace(tmp_path, _DNS_CACHE_PATH)
+    except OSError as e:
+        logger.warning(f"Could not write DNS cache: {e}")
+    return address
+
+def _pin_wttr_address() -> bool:
+    """Route session requests for wttr.in to its cached address, skipping DNS."""
+    prefix = f"https://{WTTR_HOST}/"
+    if isinstance(_SESSION.get_adapter(prefix), _PinnedHostAdapter):
+        return True
+
+    address = _resolve_wttr()
+    if not address:
+        return False
+    _SESSION.mount(prefix, _PinnedHostAdapter(WTTR_HOST, address,
+                                              pool_connections=4, pool_maxsize=10))
+    return True
+
+def _forget_wttr_address():
+    """Drop the pinned wttr.in address, both for this session and on disk."""
+    adapter = _SESSION.adapters.pop(f"https://{WTTR_HOST}/", None)
+    if adapter is not None:
+        adapter.close()
+    try:
+        _DNS_CACHE_PATH.unlink()
+    except OSError:
+        pass
+
+def _fetch_wttr(url: str, **kwargs) -> requests.Response:
+    """GET from wttr.in via the pinned address, retrying once with real DNS if it fails."""
+    # The stdlib resolver doesn't expose record TTLs, so a moved host is only
+    # noticed when connecting to the old address fails
+    if not _pin_wttr_address():
+        return _SESSION.get(url, **kwargs)
+    try:
+        return _SESSION.get(url, **kwargs)
+    except requests.exceptions.ConnectionError as e:
+        logger.warning(f"Pinned {WTTR_HOST} address failed ({e}), retrying with a fresh lookup")
+        _forget_wttr_address()
+        return _SESSION.get(url, **kwargs)
+
 class WeatherBot:
     def __init__(self, serial_port: str = DEFAULT_SERIAL_PORT, 
-                 channel: int = DEFAULT_CHANNEL, concise: bool = False):
+                 channel: int = DEFAULT_CHANNEL, concise: bool = False,
+                 compress: bool = False):
         self.serial_port = serial_port
         self.channel = channel
         self.concise = concise
+        self.compress = compress
         self.interface = None
 
     def get_weather(self, location: str) -> Optional[Dict[Any, Any]]:
         """Fetches weather data from wttr.in in JSON format."""
+        entry, age = self._read_cache(location)
+        if entry is not None and age < CACHE_TTL:
+            logger.info(f"Using cached weather data for: {location}")
+            return entry['body']
+
         try:
-            url = f"https://wttr.in/{location}"
+            url = f"https://{WTTR_HOST}/{location}"
             params = {'format': 'j1'}
             
+            # Revalidate an expired cache entry instead of re-downloading it
+            headers = {}
+            if entry is not None:
+                if entry.get('etag'):
+                    headers['If-None-Match'] = entry['etag']
+                if entry.get('last_modified'):
+                    headers['If-Modified-Since'] = entry['last_modified']
+            
             logger.info(f"Fetching weather from: {url}")
-            response = requests.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            response = _fetch_wttr(url, params=params, headers=headers,
+                                   timeout=REQUEST_TIMEOUT)
+            
+            if response.status_code == 304 and entry is not None:
+                logger.info("Weather data not modified, reusing cached copy")
+                self._touch_cache(location)
+                return entry['body']
+            
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             logger.info("Weather data retrieved successfully")
+            self._write_cache(location, data,
+                              etag=response.headers.get('ETag'),
+                              last_modified=response.headers.get('Last-Modified'))
             return data
             
         except requests.exceptions.Timeout:
@@ -59,13 +406,62 @@ class WeatherBot:
             logger.error("Connection error - check your internet connection")
         except requests.exceptions.HTTPError as e:
             logger.error(f"HTTP error: {e}")
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.error("Invalid JSON response from weather service")
         except Exception as e:
             logger.error(f"Unexpected error fetching weather: {e}")
         
+        # Stale weather is better than no weather on a flaky uplink
+        if entry is not None:
+            logger.warning(f"Using stale cached weather data ({int(age)}s old)")
+            return dict(entry['body'], _stale=True)
+        
         return None
 
+    def _read_cache(self, location: str) -> Tuple[Optional[Dict[str, Any]], float]:
+        """Return the cached entry for a location and its age in seconds."""
+        if CACHE_TTL <= 0 or not _secure_cache_dir():
+            return None, 0.0
+
+        path = _cache_path(location)
+        try:
+            age = time.time() - os.stat(path).st_mtime
+            entry = orjson.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None, 0.0
+
+        if not isinstance(entry, dict) or 'body' not in entry:
+            return None, 0.0
+        return entry, age
+
+    def _write_cache(self, location: str, data: Dict[Any, Any],
+                     etag: Optional[str] = None,
+                     last_modified: Optional[str] = None):
+        """Atomically store weather data and its validators in the on-disk cache."""
+        if CACHE_TTL <= 0 or not _secure_cache_dir():
+            return
+
+        entry = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'body': data
+        }
+
+        path = _cache_path(location)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            tmp_path.write_bytes(orjson.dumps(entry))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write weather cache: {e}")
+
+    def _touch_cache(self, location: str):
+        """Mark a revalidated cache entry as fresh."""
+        try:
+            os.utime(_cache_path(location), None)
+        except OSError as e:
+            logger.warning(f"Could not refresh weather cache: {e}")
+
     def format_weather_messages(self, weather_data: Dict[Any, Any]) -> List[str]:
         """Formats weather data into concise strings for Meshtastic."""
         if not weather_data or 'current_condition' not in weather_data:
@@ -78,13 +474,17 @@ class WeatherBot:
             location_info = self._extract_location_info(weather_data)
             weather_info = self._extract_weather_info(current)
             
+            stale_prefix = "[stale] " if weather_data.get('_stale') else ""
+            
             if self.concise:
-                return self._create_concise_message(location_info, weather_info)
+                messages = self._create_concise_message(location_info, weather_info)
+                messages[0] = stale_prefix + messages[0]
+                return messages
             else:
                 astronomy_info = self._extract_astronomy_info(weather_data)
                 
                 # Create primary weather message
-                message1 = self._create_primary_message(location_info, weather_info)
+                message1 = stale_prefix + self._create_primary_message(location_info, weather_info)
                 
                 # Create secondary message with additional info
                 message2 = self._create_secondary_message(weather_info, astronomy_info)
@@ -98,86 +498,39 @@ class WeatherBot:
 
     def _extract_location_info(self, weather_data: Dict[Any, Any]) -> Dict[str, str]:
         """Extract location information from weather data."""
-        location_info = {
-            'area': 'Unknown Location',
-            'region': ''
-        }
-        
-        if ('nearest_area' in weather_data and 
-            len(weather_data['nearest_area']) > 0):
-            nearest = weather_data['nearest_area'][0]
-            
-            if ('areaName' in nearest and 
-                len(nearest['areaName']) > 0):
-                location_info['area'] = nearest['areaName'][0]['value']
-            
-            if ('region' in nearest and 
-                len(nearest['region']) > 0):
-                location_info['region'] = nearest['region'][0]['value']
-        
-        return location_info
+        return _extract_fields(weather_data, _LOCATION_FIELDS)
 
-    def _extract_weather_info(self, current: Dict[Any, Any]) -> Dict[str, str]:
+    def _extract_weather_info(self, current: Dict[Any, Any]) -> Dict[str, Any]:
         """Extract weather information from current conditions."""
-        weather_desc = 'N/A'
-        if ('weatherDesc' in current and 
-            len(current['weatherDesc']) > 0):
-            weather_desc = current['weatherDesc'][0]['value']
+        weather_info = _extract_fields(current, _WEATHER_FIELDS)
         
-        return {
-            'temp_c': current.get('temp_C', 'N/A'),
-            'temp_f': current.get('temp_F', 'N/A'),
-            'feels_like_c': current.get('FeelsLikeC', 'N/A'),
-            'feels_like_f': current.get('FeelsLikeF', 'N/A'),
-            'description': weather_desc,
-            'humidity': current.get('humidity', 'N/A'),
-            'wind_speed': current.get('windspeedKmph', 'N/A'),
-            'wind_dir': current.get('winddir16Point', 'N/A'),
-            'obs_time': current.get('observation_time', 'N/A'),
-            'local_time': current.get('localObsDateTime', 'N/A')
-        }
+        # Parse numeric fields once so the formatters get ints or None
+        weather_info['humidity'] = _int_or_none(weather_info['humidity'])
+        weather_info['wind_speed'] = _int_or_none(weather_info['wind_speed'])
+        return weather_info
 
     def _extract_astronomy_info(self, weather_data: Dict[Any, Any]) -> Dict[str, str]:
         """Extract sunrise/sunset information."""
-        astronomy_info = {
-            'sunrise': 'N/A',
-            'sunset': 'N/A'
-        }
-        
-        if ('weather' in weather_data and 
-            len(weather_data['weather']) > 0 and 
-            'astronomy' in weather_data['weather'][0] and 
-            len(weather_data['weather'][0]['astronomy']) > 0):
-            astronomy_data = weather_data['weather'][0]['astronomy'][0]
-            astronomy_info['sunrise'] = astronomy_data.get('sunrise', 'N/A')
-            astronomy_info['sunset'] = astronomy_data.get('sunset', 'N/A')
-        
-        return astronomy_info
+        return _extract_fields(weather_data, _ASTRONOMY_FIELDS)
 
     def _create_primary_message(self, location_info: Dict[str, str], 
-                              weather_info: Dict[str, str]) -> str:
+                              weather_info: Dict[str, Any]) -> str:
         """Create the primary weather message."""
         location_str = location_info['area']
         if location_info['region']:
             location_str += f", {location_info['region']}"
         
-        return f"""Weather in {location_str}:
-Time: {weather_info['local_time']}
-Temp: {weather_info['temp_c']}°C ({weather_info['temp_f']}°F)
-RealFeel: {weather_info['feels_like_c']}°C ({weather_info['feels_like_f']}°F)
-Conditions: {weather_info['description']}
-Humidity: {weather_info['humidity']}%"""
-
-    def _create_secondary_message(self, weather_info: Dict[str, str], 
+        return _PRIMARY_TEMPLATE.format_map(
+            collections.ChainMap({'location': location_str}, _for_display(weather_info)))
+
+    def _create_secondary_message(self, weather_info: Dict[str, Any], 
                                 astronomy_info: Dict[str, str]) -> str:
         """Create the secondary weather message."""
-        return f"""Wind: {weather_info['wind_speed']}km/h {weather_info['wind_dir']}
-Sunrise: {astronomy_info['sunrise']}
-Sunset: {astronomy_info['sunset']}
-Last Obs UTC: {weather_info['obs_time']}"""
+        return _SECONDARY_TEMPLATE.format_map(
+            collections.ChainMap(_for_display(weather_info), astronomy_info))
 
     def _create_concise_message(self, location_info: Dict[str, str], 
-                              weather_info: Dict[str, str]) -> List[str]:
+                              weather_info: Dict[str, Any]) -> List[str]:
         """Create a concise natural language weather message."""
         location_str = location_info['area']
         if location_info['region']:
@@ -186,31 +539,27 @@ Last Obs UTC: {weather_info['obs_time']}"""
         # Clean up condition text
         condition = weather_info['description'].lower()
         
-        # Build natural language message
-        message = f"Weather in {location_str} is {condition} today"
+        # Build natural language message from parts, joined once at the end
+        parts = [_CONCISE_TEMPLATE.format(location=location_str, condition=condition)]
         
         # Add temperature
         if weather_info['temp_c'] != 'N/A':
-            message += f" with {weather_info['temp_c']}°C"
+            parts.append(_CONCISE_TEMP_TEMPLATE.format_map(weather_info))
             if (weather_info['feels_like_c'] != 'N/A' and 
                 weather_info['feels_like_c'] != weather_info['temp_c']):
-                message += f" (feels like {weather_info['feels_like_c']}°C)"
+                parts.append(_CONCISE_FEELS_TEMPLATE.format_map(weather_info))
         
         # Add wind info
-        if (weather_info['wind_speed'] != 'N/A' and 
-            weather_info['wind_speed'] != '0'):
+        if weather_info['wind_speed']:
             wind_dir = weather_info['wind_dir'] if weather_info['wind_dir'] != 'N/A' else ''
-            message += f" and winds at {weather_info['wind_speed']}km/h {wind_dir}".rstrip()
+            parts.append(_CONCISE_WIND_TEMPLATE.format(
+                wind_speed=weather_info['wind_speed'], wind_dir=wind_dir).rstrip())
         
         # Add humidity if significant
-        if weather_info['humidity'] != 'N/A':
-            try:
-                humidity_val = int(weather_info['humidity'])
-                if humidity_val >= 70:
-                    message += f". Humidity {humidity_val}%"
-            except (ValueError, TypeError):
-                pass
+        if weather_info['humidity'] is not None and weather_info['humidity'] >= 70:
+            parts.append(_CONCISE_HUMIDITY_TEMPLATE.format_map(weather_info))
         
+        message = "".join(parts)
         logger.info(f"Generated concise message: {message}")
         return [message]
 
@@ -218,7 +567,8 @@ Last Obs UTC: {weather_info['obs_time']}"""
         """Optimize message length for Meshtastic transmission."""
         full_message = message1 + "\n" + message2
         
-        if len(full_message) <= MAX_MESSAGE_LENGTH:
+        # The radio limit is in bytes, and the degree signs encode to two each
+        if len(self._encode_payload(full_message)) <= MAX_MESSAGE_LENGTH:
             return [full_message]
         else:
             messages = [message1]
@@ -226,12 +576,35 @@ Last Obs UTC: {weather_info['obs_time']}"""
                 messages.append(message2)
             return messages
 
+    def build_observation(self, weather_data: Dict[Any, Any]) -> Optional[bytes]:
+        """Build a binary observation frame from weather data."""
+        try:
+            current = weather_data['current_condition'][0]
+        except (KeyError, IndexError, TypeError):
+            logger.error("Weather data has no current conditions")
+            return None
+        return encode_observation(self._extract_weather_info(current),
+                                  stale=bool(weather_data.get('_stale')))
+
+    def _encode_payload(self, message: str) -> bytes:
+        """Encode a message as it will go over the air."""
+        if self.compress:
+            return compress_message(message)
+        return message.encode('utf-8')
+
     def connect_meshtastic(self) -> bool:
         """Connect to Meshtastic device, with fallback for /dev/ttyACM0."""
+        # Imported here so --dry-run doesn't pay for meshtastic's import time
+        try:
+            import meshtastic.serial_interface
+        except Exception as e:
+            logger.error(f"Could not load the meshtastic library: {e}")
+            return False
+        
         try:
             logger.info(f"Connecting to Meshtastic device on {self.serial_port}")
             self.interface = meshtastic.serial_interface.SerialInterface(self.serial_port)
-            time.sleep(1)  # Allow interface to initialize
+            self._wait_for_interface()
             logger.info(f"Connected to Meshtastic device on {self.serial_port}")
             return True
         except Exception as e:
@@ -241,7 +614,7 @@ Last Obs UTC: {weather_info['obs_time']}"""
                 try:
                     fallback_port = '/dev/ttyUSB0'
                     self.interface = meshtastic.serial_interface.SerialInterface(fallback_port)
-                    time.sleep(1)  # Allow interface to initialize
+                    self._wait_for_interface()
                     logger.info(f"Connected to Meshtastic device on {fallback_port}")
                     return True
                 except Exception as e2:
@@ -251,6 +624,13 @@ Last Obs UTC: {weather_info['obs_time']}"""
                 logger.error(f"Failed to connect to Meshtastic device: {e}")
                 return False
 
+    def _wait_for_interface(self):
+        """Poll until the radio has reported its node info, up to INTERFACE_READY_TIMEOUT."""
+        deadline = time.monotonic() + INTERFACE_READY_TIMEOUT
+        while (getattr(self.interface, 'myInfo', None) is None and
+               time.monotonic() < deadline):
+            time.sleep(0.01)
+
     def disconnect_meshtastic(self):
         """Disconnect from Meshtastic device."""
         if self.interface:
@@ -262,38 +642,81 @@ Last Obs UTC: {weather_info['obs_time']}"""
             finally:
                 self.interface = None
 
-    def send_message(self, message: str) -> bool:
-        """Send a single message via Meshtastic."""
+    def send_message(self, message: str, wait_for_ack: bool = False) -> bool:
+        """Send a single message via Meshtastic, optionally blocking until it is ACKed."""
         if not self.interface:
             logger.error("Meshtastic interface not connected")
             return False
         
+        from meshtastic.protobuf import portnums_pb2
+        
+        if self.compress:
+            port_num = portnums_pb2.PortNum.PRIVATE_APP
+        else:
+            port_num = portnums_pb2.PortNum.TEXT_MESSAGE_APP
+        payload = self._encode_payload(message)
+        
+        if not self._send_payload(payload, port_num, wait_for_ack):
+            return False
+        logger.info(f"Message content ({len(message)} chars, {len(payload)} bytes): {message}")
+        return True
+
+    def _send_payload(self, payload: bytes, port_num: int, wait_for_ack: bool) -> bool:
+        """Send raw bytes on a port, optionally blocking until they are ACKed."""
+        ack_event = threading.Event()
+        ack_packet = {}
+        
+        def on_ack(packet):
+            ack_packet.update(packet)
+            ack_event.set()
+        
         try:
-            self.interface.sendText(message, channelIndex=self.channel)
+            # Same as sendText, but lets the ACK itself trigger the response callback.
+            # Only ask for an ACK when we'll wait on it: on a broadcast, wantAck makes
+            # the firmware retransmit until it hears a neighbour rebroadcast.
+            if wait_for_ack:
+                self.interface.sendData(
+                    payload,
+                    portNum=port_num,
+                    wantAck=True,
+                    onResponse=on_ack,
+                    onResponseAckPermitted=True,
+                    channelIndex=self.channel
+                )
+            else:
+                self.interface.sendData(payload, portNum=port_num, channelIndex=self.channel)
             logger.info(f"Message sent to channel {self.channel}")
-            logger.info(f"Message content ({len(message)} chars): {message}")
-            return True
         except Exception as e:
             logger.error(f"Error sending message: {e}")
             return False
+        
+        if wait_for_ack:
+            if not ack_event.wait(ACK_TIMEOUT):
+                logger.warning(f"No ACK after {ACK_TIMEOUT} seconds, continuing")
+            else:
+                error = ack_packet.get('decoded', {}).get('routing', {}).get('errorReason', 'NONE')
+                if error != 'NONE':
+                    logger.warning(f"Message NAKed by radio: {error}")
+                else:
+                    logger.info("Message ACKed")
+        
+        return True
 
     def send_weather_messages(self, messages: List[str]) -> bool:
-        """Send multiple weather messages with appropriate delays."""
-        if not self.connect_meshtastic():
+        """Send multiple weather messages, pacing them on radio ACKs."""
+        # Reuse an already-open interface rather than re-enumerating the serial port
+        if not self.interface and not self.connect_meshtastic():
             return False
         
         try:
             logger.info(f"Sending {len(messages)} weather message(s)")
             
             for i, message in enumerate(messages):
-                if not self.send_message(message):
+                # Wait for the radio to ACK each message before queuing the next
+                wait_for_ack = i < len(messages) - 1
+                if not self.send_message(message, wait_for_ack=wait_for_ack):
                     logger.error(f"Failed to send message {i+1}, aborting")
                     return False
-                
-                # Add delay between messages if sending multiple
-                if i < len(messages) - 1:
-                    logger.info(f"Waiting {MESSAGE_DELAY} seconds before next message...")
-                    time.sleep(MESSAGE_DELAY)
             
             logger.info("All weather messages sent successfully")
             return True
@@ -301,8 +724,47 @@ Last Obs UTC: {weather_info['obs_time']}"""
         finally:
             self.disconnect_meshtastic()
 
+    def send_observation(self, payload: bytes) -> bool:
+        """Send a binary observation frame on the private app port."""
+        if not self.interface and not self.connect_meshtastic():
+            return False
+        
+        from meshtastic.protobuf import portnums_pb2
+        
+        try:
+            if not self._send_payload(payload, portnums_pb2.PortNum.PRIVATE_APP,
+                                      wait_for_ack=False):
+                return False
+            logger.info(f"Observation sent ({len(payload)} bytes)")
+            return True
+        finally:
+            self.disconnect_meshtastic()
+
 def parse_arguments():
     """Parse command line arguments."""
+    # The bare cron invocation needs only the defaults, so skip building the parser
+    if len(sys.argv) == 1:
+        return types.SimpleNamespace(
+            location=DEFAULT_WEATHER_LOCATION,
+            port=DEFAULT_SERIAL_PORT,
+            channel=DEFAULT_CHANNEL,
+            dry_run=False,
+            verbose=False,
+            concise=False,
+            compress=False,
+            binary=False
+        )
+    
+    parser = _build_parser()
+    args = parser.parse_args()
+    if args.binary and args.compress:
+        parser.error("--binary frames are not text, so they can't be combined with --compress")
+    return args
+
+def _build_parser():
+    """Build the command line parser."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Send weather information via Meshtastic radio'
     )
@@ -345,7 +807,19 @@ def parse_arguments():
         help='Send concise natural language weather summary'
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        '--compress',
+        action='store_true',
+        help='Send zlib-compressed messages on the private app port (receivers must decompress)'
+    )
+    
+    parser.add_argument(
+        '--binary',
+        action='store_true',
+        help='Send a packed binary observation on the private app port instead of text'
+    )
+    
+    return parser
 
 def main():
     """Main execution function."""
@@ -359,15 +833,26 @@ def main():
     weather_bot = WeatherBot(
         serial_port=args.port,
         channel=args.channel,
-        concise=args.concise
+        concise=args.concise,
+        compress=args.compress
     )
     
+    # Open the radio in the background while the weather fetch is in flight
+    connect_future = None
+    if not args.dry_run:
+        executor = ThreadPoolExecutor(max_workers=1)
+        connect_future = executor.submit(weather_bot.connect_meshtastic)
+        executor.shutdown(wait=False)
+    
     # Fetch weather data
     logger.info(f"Fetching weather for: {args.location}")
     weather_data = weather_bot.get_weather(args.location)
     
     if not weather_data:
         logger.error("Failed to retrieve weather data")
+        if connect_future:
+            connect_future.result()
+            weather_bot.disconnect_meshtastic()
         return 1
     
     # Format weather messages
@@ -380,12 +865,35 @@ def main():
         print(msg)
         print("-" * 50)
     
+    # Binary mode sends a packed observation instead of the text messages
+    observation = None
+    if args.binary:
+        observation = weather_bot.build_observation(weather_data)
+        if observation is None:
+            if connect_future:
+                connect_future.result()
+                weather_bot.disconnect_meshtastic()
+            return 1
+        print(f"\n--- Binary Observation ({len(observation)} bytes) ---")
+        print(observation.hex())
+        print("-" * 50)
+    
     # Send messages (unless dry run)
     if args.dry_run:
         logger.info("Dry run mode - not sending to Meshtastic")
         return 0
     
-    if weather_bot.send_weather_messages(weather_messages):
+    # connect_meshtastic has already tried the fallback port and logged why it failed
+    if not connect_future.result():
+        logger.error("Weather transmission failed")
+        return 1
+    
+    if observation is not None:
+        sent = weather_bot.send_observation(observation)
+    else:
+        sent = weather_bot.send_weather_messages(weather_messages)
+    
+    if sent:
         logger.info("Weather transmission completed successfully")
         return 0
     else:
@@ -0,0 +1,402 @@
+import calendar
+import os
+import pathlib
+import socket
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import MeshWttrv3  # noqa: E402
+import orjson  # noqa: E402
+import requests  # noqa: E402
+
+SAMPLE_MESSAGE = (
+    "Weather in Dunlap, Tennessee:\n"
+    "Time: 2026-10-15 09:00 AM\n"
+    "Temp: 20°C (68°F)\n"
+    "RealFeel: 19°C (66°F)\n"
+    "Conditions: Partly cloudy\n"
+    "Humidity: 80%\n"
+    "Wind: 11km/h NW\n"
+    "Sunrise: 07:30 AM\n"
+    "Sunset: 06:45 PM\n"
+    "Last Obs UTC: 01:00 PM"
+)
+
+
+SAMPLE_WEATHER = {
+    'nearest_area': [{
+        'areaName': [{'value': 'Dunlap'}],
+        'region': [{'value': 'Tennessee'}]
+    }],
+    'current_condition': [{
+        'temp_C': '20',
+        'temp_F': '68',
+        'FeelsLikeC': '19',
+        'FeelsLikeF': '66',
+        'weatherDesc': [{'value': 'Partly cloudy'}],
+        'humidity': '80',
+        'windspeedKmph': '11',
+        'winddir16Point': 'NW',
+        'observation_time': '01:00 PM',
+        'localObsDateTime': '2026-10-15 09:00 AM'
+    }],
+    'weather': [{'astronomy': [{'sunrise': '07:30 AM', 'sunset': '06:45 PM'}]}]
+}
+
+
+def utc_epoch(*args):
+    return calendar.timegm((*args, 0, 0, 0, 0))
+
+
+class CompressionTests(unittest.TestCase):
+    def test_round_trip(self):
+        payload = MeshWttrv3.compress_message(SAMPLE_MESSAGE)
+        self.assertEqual(MeshWttrv3.decompress_message(payload), SAMPLE_MESSAGE)
+
+    def test_round_trip_non_ascii(self):
+        message = "Météo à Zürich: -3°C, neige ❄"
+        payload = MeshWttrv3.compress_message(message)
+        self.assertEqual(MeshWttrv3.decompress_message(payload), message)
+
+    def test_round_trip_empty(self):
+        payload = MeshWttrv3.compress_message("")
+        self.assertEqual(MeshWttrv3.decompress_message(payload), "")
+
+    def test_version_byte(self):
+        payload = MeshWttrv3.compress_message(SAMPLE_MESSAGE)
+        self.assertEqual(payload[0], MeshWttrv3.COMPRESSION_VERSION)
+
+    def test_shrinks_typical_message(self):
+        payload = MeshWttrv3.compress_message(SAMPLE_MESSAGE)
+        self.assertLess(len(payload), len(SAMPLE_MESSAGE.encode('utf-8')))
+
+    def test_rejects_wrong_version(self):
+        payload = MeshWttrv3.compress_message(SAMPLE_MESSAGE)
+        with self.assertRaises(ValueError):
+            MeshWttrv3.decompress_message(bytes([MeshWttrv3.OBSERVATION_VERSION]) + payload[1:])
+
+    def test_rejects_empty_payload(self):
+        with self.assertRaises(ValueError):
+            MeshWttrv3.decompress_message(b"")
+
+
+class ObservationTests(unittest.TestCase):
+    def setUp(self):
+        self.bot = MeshWttrv3.WeatherBot()
+
+    def test_round_trip(self):
+        payload = self.bot.build_observation(SAMPLE_WEATHER)
+        self.assertEqual(MeshWttrv3.decode_observation(payload), {
+            'temp_c': 20.0,
+            'feels_like_c': 19.0,
+            'humidity': 80,
+            'wind_dir': 'NW',
+            'wind_speed': 11,
+            'obs_epoch': utc_epoch(2026, 10, 15, 13, 0),
+            'description': 'Partly cloudy',
+            'stale': False
+        })
+
+    def test_round_trip_missing_fields(self):
+        payload = self.bot.build_observation({'current_condition': [{}]})
+        self.assertEqual(MeshWttrv3.decode_observation(payload), {
+            'temp_c': None,
+            'feels_like_c': None,
+            'humidity': None,
+            'wind_dir': None,
+            'wind_speed': None,
+            'obs_epoch': None,
+            'description': None,
+            'stale': False
+        })
+
+    def test_round_trip_non_ascii_and_negative(self):
+        current = dict(SAMPLE_WEATHER['current_condition'][0],
+                       temp_C='-7', FeelsLikeC='-12',
+                       weatherDesc=[{'value': 'Neige modérée ❄'}])
+        payload = self.bot.build_observation({'current_condition': [current]})
+        decoded = MeshWttrv3.decode_observation(payload)
+        self.assertEqual(decoded['temp_c'], -7.0)
+        self.assertEqual(decoded['feels_like_c'], -12.0)
+        self.assertEqual(decoded['description'], 'Neige modérée ❄')
+
+    def test_stale_flag(self):
+        payload = self.bot.build_observation(dict(SAMPLE_WEATHER, _stale=True))
+        self.assertTrue(MeshWttrv3.decode_observation(payload)['stale'])
+
+    def test_epoch_uses_observation_date_not_today(self):
+        current = dict(SAMPLE_WEATHER['current_condition'][0],
+                       localObsDateTime='2020-02-29 09:00 AM')
+        payload = self.bot.build_observation({'current_condition': [current]})
+        self.assertEqual(MeshWttrv3.decode_observation(payload)['obs_epoch'],
+                         utc_epoch(2020, 2, 29, 13, 0))
+
+    def test_epoch_utc_next_day(self):
+        # 8 PM at UTC-5 is 1 AM UTC the following day
+        self.assertEqual(MeshWttrv3._observation_epoch('01:00 AM', '2026-10-15 08:00 PM'),
+                         utc_epoch(2026, 10, 16, 1, 0))
+
+    def test_epoch_utc_previous_day(self):
+        # 9 AM at UTC+13 is 8 PM UTC the previous day
+        self.assertEqual(MeshWttrv3._observation_epoch('08:00 PM', '2026-10-16 09:00 AM'),
+                         utc_epoch(2026, 10, 15, 20, 0))
+
+    def test_epoch_unparseable(self):
+        self.assertEqual(MeshWttrv3._observation_epoch('N/A', 'N/A'), 0)
+
+    def test_out_of_range_values_are_clamped(self):
+        current = dict(SAMPLE_WEATHER['current_condition'][0],
+                       temp_C='5000', FeelsLikeC='-5000', humidity='-3', windspeedKmph='-1')
+        payload = self.bot.build_observation({'current_condition': [current]})
+        decoded = MeshWttrv3.decode_observation(payload)
+        self.assertEqual(decoded['temp_c'], 3276.7)
+        self.assertEqual(decoded['feels_like_c'], -3276.7)
+        self.assertEqual(decoded['humidity'], 0)
+        self.assertEqual(decoded['wind_speed'], 0)
+
+    def test_long_description_fits_one_packet(self):
+        # Three-byte characters so the cut lands mid-character
+        current = dict(SAMPLE_WEATHER['current_condition'][0],
+                       weatherDesc=[{'value': 'a' + '❄' * 100}])
+        payload = self.bot.build_observation({'current_condition': [current]})
+        self.assertLessEqual(len(payload), MeshWttrv3.MAX_MESSAGE_LENGTH)
+        self.assertEqual(MeshWttrv3.decode_observation(payload)['description'], 'a' + '❄' * 72)
+
+    def test_rejects_wrong_version(self):
+        payload = self.bot.build_observation(SAMPLE_WEATHER)
+        with self.assertRaises(ValueError):
+            MeshWttrv3.decode_observation(bytes([MeshWttrv3.COMPRESSION_VERSION]) + payload[1:])
+
+    def test_rejects_truncated_payload(self):
+        payload = self.bot.build_observation(SAMPLE_WEATHER)
+        with self.assertRaises(ValueError):
+            MeshWttrv3.decode_observation(payload[:5])
+
+
+class WeatherCacheTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cache_dir = pathlib.Path(tmp.name) / 'cache'
+        for name, value in [('_CACHE_DIR', cache_dir),
+                            ('_DNS_CACHE_PATH', cache_dir / 'dns.json'),
+                            ('CACHE_TTL', 900)]:
+            patcher = mock.patch.object(MeshWttrv3, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(MeshWttrv3, '_pin_wttr_address', return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(MeshWttrv3._SESSION, 'get')
+        self.get = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.bot = MeshWttrv3.WeatherBot()
+
+    def cache_entry(self, body, age, etag='"abc"', last_modified='Thu, 15 Oct 2026 12:00:00 GMT'):
+        self.bot._write_cache('37397', body, etag=etag, last_modified=last_modified)
+        then = time.time() - age
+        os.utime(MeshWttrv3._cache_path('37397'), (then, then))
+
+    def response(self, status_code, body=None, headers=None):
+        response = mock.Mock(status_code=status_code, headers=headers or {},
+                             content=orjson.dumps(body) if body is not None else b'')
+        response.raise_for_status.return_value = None
+        return response
+
+    def test_fresh_entry_skips_request(self):
+        self.cache_entry(SAMPLE_WEATHER, age=10)
+        self.assertEqual(self.bot.get_weather('37397'), SAMPLE_WEATHER)
+        self.get.assert_not_called()
+
+    def test_not_modified_reuses_cached_body(self):
+        self.cache_entry(SAMPLE_WEATHER, age=3600)
+        self.get.return_value = self.response(304)
+
+        self.assertEqual(self.bot.get_weather('37397'), SAMPLE_WEATHER)
+        headers = self.get.call_args.kwargs['headers']
+        self.assertEqual(headers['If-None-Match'], '"abc"')
+        self.assertEqual(headers['If-Modified-Since'], 'Thu, 15 Oct 2026 12:00:00 GMT')
+        entry, age = self.bot._read_cache('37397')
+        self.assertLess(age, 60)
+        self.assertEqual(entry['body'], SAMPLE_WEATHER)
+
+    def test_modified_replaces_cached_body(self):
+        self.cache_entry({'old': True}, age=3600)
+        self.get.return_value = self.response(200, SAMPLE_WEATHER, {'ETag': '"def"'})
+
+        self.assertEqual(self.bot.get_weather('37397'), SAMPLE_WEATHER)
+        entry, _ = self.bot._read_cache('37397')
+        self.assertEqual(entry['etag'], '"def"')
+        self.assertEqual(entry['body'], SAMPLE_WEATHER)
+
+    def test_no_entry_sends_unconditional_request(self):
+        self.get.return_value = self.response(200, SAMPLE_WEATHER)
+        self.assertEqual(self.bot.get_weather('37397'), SAMPLE_WEATHER)
+        self.assertEqual(self.get.call_args.kwargs['headers'], {})
+
+    def test_network_failure_serves_stale_entry(self):
+        self.cache_entry(SAMPLE_WEATHER, age=3 * 86400)
+        self.get.side_effect = requests.exceptions.ConnectionError("offline")
+
+        data = self.bot.get_weather('37397')
+        self.assertTrue(data['_stale'])
+        self.assertEqual(data['current_condition'], SAMPLE_WEATHER['current_condition'])
+        self.assertTrue(self.bot.format_weather_messages(data)[0].startswith("[stale] "))
+
+    def test_http_error_serves_stale_entry(self):
+        self.cache_entry(SAMPLE_WEATHER, age=3600)
+        response = self.response(503)
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError("503")
+        self.get.return_value = response
+
+        self.assertTrue(self.bot.get_weather('37397')['_stale'])
+
+    def test_stale_concise_message_is_prefixed(self):
+        self.cache_entry(SAMPLE_WEATHER, age=3600)
+        self.get.side_effect = requests.exceptions.Timeout("slow")
+
+        bot = MeshWttrv3.WeatherBot(concise=True)
+        messages = bot.format_weather_messages(bot.get_weather('37397'))
+        self.assertTrue(messages[0].startswith("[stale] Weather in Dunlap"))
+
+    def test_network_failure_without_entry_returns_none(self):
+        self.get.side_effect = requests.exceptions.ConnectionError("offline")
+        self.assertIsNone(self.bot.get_weather('37397'))
+
+
+def addrinfo(address):
+    family = socket.AF_INET6 if ':' in address else socket.AF_INET
+    return [(family, socket.SOCK_STREAM, 6, '', (address, 443))]
+
+
+class PinnedAddressTests(unittest.TestCase):
+    PREFIX = f"https://{MeshWttrv3.WTTR_HOST}/"
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cache_dir = pathlib.Path(tmp.name) / 'cache'
+        self.dns_path = cache_dir / 'dns.json'
+        for name, value in [('_CACHE_DIR', cache_dir),
+                            ('_DNS_CACHE_PATH', self.dns_path),
+                            ('CACHE_TTL', 900)]:
+            patcher = mock.patch.object(MeshWttrv3, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(MeshWttrv3.socket, 'getaddrinfo',
+                                    return_value=addrinfo('203.0.113.7'))
+        self.getaddrinfo = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(MeshWttrv3._SESSION, 'get')
+        self.get = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(MeshWttrv3._SESSION.adapters.pop, self.PREFIX, None)
+
+    def write_dns_cache(self, address, age):
+        MeshWttrv3._secure_cache_dir()
+        self.dns_path.write_bytes(orjson.dumps({'address': address}))
+        then = time.time() - age
+        os.utime(self.dns_path, (then, then))
+
+    def pinned_adapter(self):
+        adapter = MeshWttrv3._SESSION.get_adapter(self.PREFIX)
+        return adapter if isinstance(adapter, MeshWttrv3._PinnedHostAdapter) else None
+
+    def test_resolves_and_persists(self):
+        self.assertEqual(MeshWttrv3._resolve_wttr(), '203.0.113.7')
+        self.assertEqual(orjson.loads(self.dns_path.read_bytes()), {'address': '203.0.113.7'})
+
+    def test_reuses_fresh_dns_cache(self):
+        self.write_dns_cache('198.51.100.1', age=60)
+        self.assertEqual(MeshWttrv3._resolve_wttr(), '198.51.100.1')
+        self.getaddrinfo.assert_not_called()
+
+    def test_re_resolves_expired_dns_cache(self):
+        self.write_dns_cache('198.51.100.1', age=MeshWttrv3.DNS_CACHE_TTL + 60)
+        self.assertEqual(MeshWttrv3._resolve_wttr(), '203.0.113.7')
+        self.getaddrinfo.assert_called_once()
+        self.assertEqual(orjson.loads(self.dns_path.read_bytes()), {'address': '203.0.113.7'})
+
+    def test_resolution_failure_skips_pin(self):
+        self.getaddrinfo.side_effect = socket.gaierror("no DNS")
+        self.assertFalse(MeshWttrv3._pin_wttr_address())
+        self.assertIsNone(self.pinned_adapter())
+
+    def test_no_pin_when_cache_dir_untrusted(self):
+        with mock.patch.object(MeshWttrv3, '_secure_cache_dir', return_value=False):
+            self.assertFalse(MeshWttrv3._pin_wttr_address())
+        self.getaddrinfo.assert_not_called()
+        self.assertIsNone(self.pinned_adapter())
+
+    def test_no_pin_when_caching_disabled(self):
+        with mock.patch.object(MeshWttrv3, 'CACHE_TTL', 0):
+            self.assertFalse(MeshWttrv3._pin_wttr_address())
+        self.getaddrinfo.assert_not_called()
+        self.assertFalse(self.dns_path.exists())
+
+    def test_fetch_pins_address(self):
+        self.get.return_value = 'response'
+        self.assertEqual(MeshWttrv3._fetch_wttr(self.PREFIX + 'London', timeout=1), 'response')
+        self.assertEqual(self.pinned_adapter().address, '203.0.113.7')
+        self.get.assert_called_once()
+
+    def test_connection_error_unpins_and_retries_once(self):
+        self.write_dns_cache('198.51.100.1', age=60)
+        self.get.side_effect = [requests.exceptions.ConnectionError("refused"), 'response']
+
+        self.assertEqual(MeshWttrv3._fetch_wttr(self.PREFIX + 'London', timeout=1), 'response')
+        self.assertEqual(self.get.call_count, 2)
+        self.assertIsNone(self.pinned_adapter())
+        self.assertFalse(self.dns_path.exists())
+
+    def test_retry_failure_propagates(self):
+        self.write_dns_cache('198.51.100.1', age=60)
+        self.get.side_effect = requests.exceptions.ConnectionError("offline")
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            MeshWttrv3._fetch_wttr(self.PREFIX + 'London', timeout=1)
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_adapter_rewrites_host(self):
+        for address, netloc in [('203.0.113.7', '203.0.113.7'),
+                                ('2001:db8::7', '[2001:db8::7]')]:
+            adapter = MeshWttrv3._PinnedHostAdapter(MeshWttrv3.WTTR_HOST, address)
+            request = requests.Request('GET', self.PREFIX + 'London').prepare()
+            with mock.patch.object(requests.adapters.HTTPAdapter, 'send') as send:
+                adapter.send(request)
+            sent = send.call_args.args[0]
+            self.assertEqual(sent.url, f"https://{netloc}/London")
+            self.assertEqual(sent.headers['Host'], MeshWttrv3.WTTR_HOST)
+
+
+class ArgumentTests(unittest.TestCase):
+    def test_bare_invocation_matches_parser_defaults(self):
+        with mock.patch.object(sys, 'argv', ['MeshWttrv3.py']):
+            fast_path = vars(MeshWttrv3.parse_arguments())
+        self.assertEqual(fast_path, vars(MeshWttrv3._build_parser().parse_args([])))
+
+    def test_binary_rejects_compress(self):
+        with mock.patch.object(sys, 'argv', ['MeshWttrv3.py', '--binary', '--compress']), \
+                mock.patch('sys.stderr'):
+            with self.assertRaises(SystemExit):
+                MeshWttrv3.parse_arguments()
+
+
+class MainTests(unittest.TestCase):
+    def test_failed_background_connect_is_not_retried(self):
+        with mock.patch.object(sys, 'argv', ['MeshWttrv3.py']), \
+                mock.patch.object(MeshWttrv3.WeatherBot, 'get_weather', return_value=SAMPLE_WEATHER), \
+                mock.patch.object(MeshWttrv3.WeatherBot, 'connect_meshtastic',
+                                  return_value=False) as connect, \
+                mock.patch('builtins.print'):
+            self.assertEqual(MeshWttrv3.main(), 1)
+        connect.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()